@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+# bench.py - Benchmark suite for the PackCDN Python CLI (pack.py)
+
+import click
+import json
+import os
+import sys
+import time
+import random
+import base64
+import shutil
+import platform
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+# Status messages go to stderr so --json output stays machine-readable
+err_console = Console(stderr=True)
+PACK_SCRIPT = Path(__file__).resolve().parent / "pack.py"
+PACK_ID = "benchpack"
+SCENARIOS = ('install-miss', 'install-hit', 'search', 'info-miss', 'info-hit', 'list', 'publish')
+
+# ============================================================================
+# PACK GENERATION
+# ============================================================================
+
+def generate_files(shape, files, file_size, depth, seed=0):
+    """Generate a {path: content} mapping shaped like a real pack
+
+    small  - many text files in a flat layout
+    wasm   - a few large base64 data: URL blobs
+    deep   - text files spread across a directory tree `depth` levels deep
+    """
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyz0123456789 \n"
+    result = {}
+
+    for i in range(files):
+        if shape == 'wasm':
+            blob = bytes(rng.getrandbits(8) for _ in range(file_size))
+            result[f"module_{i}.wasm"] = "data:application/wasm;base64," + base64.b64encode(blob).decode()
+            continue
+
+        text = ''.join(rng.choice(alphabet) for _ in range(file_size))
+        if shape == 'deep':
+            parts = [f"d{(i >> level) % 4}" for level in range(depth)]
+            result['/'.join(parts + [f"file_{i}.js"])] = text
+        else:
+            result[f"file_{i}.js"] = text
+
+    return result
+
+def make_pack(files):
+    return {
+        'id': PACK_ID,
+        'url_id': PACK_ID,
+        'name': PACK_ID,
+        'version': '1.0.0',
+        'package_type': 'basic',
+        'is_public': True,
+        'created_at': '2024-01-01T00:00:00Z',
+        'pack_json': {'description': 'Generated benchmark pack'},
+        'files': files
+    }
+
+# ============================================================================
+# MOCK REGISTRY
+# ============================================================================
+
+class MockRegistry:
+    """Local stand-in for the PackCDN API, serving pre-serialized responses
+
+    delay is injected before the headers and body_delay between headers and
+    body. Setting status makes every GET fail with that status code.
+    """
+
+    def __init__(self, pack, search_results=50, delay=0.0):
+        self.delay = delay
+        self.body_delay = 0.0
+        self.status = None
+        self.requests = 0
+        self.bytes_sent = 0
+        self.lock = threading.Lock()
+
+        self.get_pack_body = json.dumps({
+            'success': True,
+            'pack': pack,
+            'install_info': {'pack_cli': f"pack install {PACK_ID}"}
+        }).encode()
+
+        summary = {k: v for k, v in pack.items() if k != 'files'}
+        self.search_body = json.dumps({
+            'success': True,
+            'packs': [{**summary, 'id': f"{PACK_ID}{i}", 'name': f"{PACK_ID}{i}"} for i in range(search_results)]
+        }).encode()
+
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def handle(self):
+                try:
+                    super().handle()
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client dropped the connection, e.g. a losing hedged request
+                    pass
+
+            def reply(self, status, body):
+                if registry.delay:
+                    time.sleep(registry.delay)
+                # Count before replying; the client may exit as soon as it has the body
+                with registry.lock:
+                    registry.requests += 1
+                    registry.bytes_sent += len(body)
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if self.command != 'HEAD':
+                    if registry.body_delay:
+                        time.sleep(registry.body_delay)
+                    self.wfile.write(body)
+
+            def do_HEAD(self):
+                self.reply(200, b'')
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if registry.status:
+                    self.reply(registry.status, json.dumps({'success': False, 'error': {'message': 'Injected'}}).encode())
+                elif url.path == '/api/get-pack':
+                    if parse_qs(url.query).get('id', [''])[0] == PACK_ID:
+                        self.reply(200, registry.get_pack_body)
+                    else:
+                        self.reply(404, json.dumps({'success': False, 'error': {'message': 'Not found'}}).encode())
+                elif url.path == '/api/search':
+                    self.reply(200, registry.search_body)
+                else:
+                    self.reply(404, b'{}')
+
+            def do_POST(self):
+                remaining = int(self.headers.get('Content-Length', 0))
+                while remaining:
+                    remaining -= len(self.rfile.read(min(remaining, 65536)))
+                self.reply(200, json.dumps({'success': True, 'id': PACK_ID}).encode())
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+LAUNCHER_SOURCE = """
+import json, os, subprocess, sys, time
+for line in sys.stdin:
+    job = json.loads(line)
+    start = time.perf_counter()
+    with open(job['stdout'], 'wb') as stdout:
+        proc = subprocess.Popen(job['argv'], env=job['env'], cwd=job['cwd'],
+                                stdout=stdout, stderr=subprocess.DEVNULL)
+        _, status, rusage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    rss = rusage.ru_maxrss // 1024 if sys.platform == 'darwin' else rusage.ru_maxrss
+    print(json.dumps([elapsed, rss, os.waitstatus_to_exitcode(status)]), flush=True)
+"""
+
+class Launcher:
+    """Small helper process that spawns and times pack.py runs
+
+    ru_maxrss of a child includes the memory of the process that forked it,
+    so spawning from this process (which holds the generated pack several
+    times over) would inflate peak RSS. The launcher is started before any
+    pack data exists and stays small.
+    """
+
+    def __init__(self):
+        self.proc = subprocess.Popen(
+            [sys.executable, '-c', LAUNCHER_SOURCE],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+        )
+        fd, self.stdout_path = tempfile.mkstemp(prefix='pack-bench-', suffix='.out')
+        os.close(fd)
+
+    def run(self, args, env, cwd):
+        """Run pack.py once, returning (seconds, peak RSS in KB, exit code, stdout)"""
+        job = {
+            'argv': [sys.executable, str(PACK_SCRIPT)] + args,
+            'env': env,
+            'cwd': str(cwd),
+            'stdout': self.stdout_path
+        }
+        self.proc.stdin.write(json.dumps(job) + "\n")
+        self.proc.stdin.flush()
+        elapsed, peak_rss, exit_code = json.loads(self.proc.stdout.readline())
+        with open(self.stdout_path, encoding='utf-8', errors='replace') as f:
+            output = f.read()
+        return elapsed, peak_rss, exit_code, output
+
+    def close(self):
+        self.proc.stdin.close()
+        self.proc.wait()
+        os.unlink(self.stdout_path)
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def summarize(name, timings, rss, failures, payload_bytes, server_requests):
+    total = sum(timings)
+    return {
+        'scenario': name,
+        'iterations': len(timings),
+        'failures': failures,
+        'latency_ms': {
+            'min': min(timings) * 1000,
+            'p50': percentile(timings, 50) * 1000,
+            'p90': percentile(timings, 90) * 1000,
+            'p99': percentile(timings, 99) * 1000,
+            'max': max(timings) * 1000,
+            'mean': total / len(timings) * 1000
+        },
+        'ops_per_sec': len(timings) / total if total else 0.0,
+        'mb_per_sec': payload_bytes * len(timings) / total / (1024 * 1024) if total and payload_bytes else 0.0,
+        'peak_rss_kb': max(rss),
+        'server_requests': server_requests
+    }
+
+class Workspace:
+    """Isolated HOME and project directory so benchmarks never touch ~/.pack"""
+
+    def __init__(self, registry_url, files, list_packs):
+        self.root = Path(tempfile.mkdtemp(prefix='pack-bench-'))
+        self.home = self.root / 'home'
+        self.project = self.root / 'project'
+        self.publish_dir = self.root / 'publish'
+        self.pack_dir = self.home / '.pack'
+        self.installed_dir = self.project / 'pack_modules' / PACK_ID
+        self.list_packs = list_packs
+
+        self.pack_dir.mkdir(parents=True)
+        self.project.mkdir()
+        with open(self.pack_dir / 'config.json', 'w') as f:
+            json.dump({'registry': registry_url, 'api_key': 'bench', 'cache_ttl': 3600}, f)
+
+        self.publish_dir.mkdir()
+        with open(self.publish_dir / 'package.json', 'w') as f:
+            json.dump({'name': PACK_ID, 'version': '1.0.0'}, f)
+        for filename, content in files.items():
+            file_path = self.publish_dir / filename
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            if content.startswith('data:'):
+                file_path.write_bytes(base64.b64decode(content.split(',', 1)[1]))
+            else:
+                file_path.write_text(content)
+
+        self.env = {**os.environ, 'HOME': str(self.home), 'PACK_NO_DAEMON': '1', 'PYTHONDONTWRITEBYTECODE': '1'}
+
+    def clear_installed(self):
+        shutil.rmtree(self.project / 'pack_modules', ignore_errors=True)
+
+    def clear_cache(self):
+        for cache_file in (self.pack_dir / 'cache').glob('*'):
+            cache_file.unlink()
+
+    def is_installed(self):
+        return (self.installed_dir / 'pack-info.json').exists()
+
+    def populate_packages(self):
+        """Fill ~/.pack/packages, the directory `pack list` reads, with copies of the pack"""
+        packages_dir = self.pack_dir / 'packages'
+        for i in range(self.list_packs):
+            package_dir = packages_dir / f"{PACK_ID}{i}"
+            if package_dir.exists():
+                continue
+            shutil.copytree(self.publish_dir, package_dir)
+            with open(package_dir / 'pack-info.json', 'w') as f:
+                json.dump({'id': f"{PACK_ID}{i}", 'name': f"{PACK_ID}{i}", 'version': '1.0.0'}, f)
+
+    def cleanup(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+class Scenario:
+    """One benchmarked command
+
+    setup runs before every iteration. pack.py exits 0 after network and
+    HTTP errors, so an iteration only counts as a success if it also made
+    exactly `requests` registry requests, printed `expect` and check() passes.
+    """
+
+    def __init__(self, argv, requests, expect, setup=None, check=None):
+        self.argv = argv
+        self.requests = requests
+        self.expect = expect
+        self.setup = setup
+        self.check = check
+
+    def succeeded(self, exit_code, made, output):
+        return (exit_code == 0
+                and made == self.requests
+                and self.expect in output
+                and (self.check is None or self.check()))
+
+def make_scenario(name, workspace, launcher):
+    def prime_cache():
+        workspace.clear_installed()
+        if not any((workspace.pack_dir / 'cache').glob('*')):
+            launcher.run(['install', PACK_ID], workspace.env, workspace.project)
+
+    def fresh_install():
+        workspace.clear_installed()
+        workspace.clear_cache()
+
+    # --force would bypass the cache, so installs start from an empty pack_modules instead
+    if name == 'install-miss':
+        return Scenario(['install', PACK_ID], 1, "Successfully installed", fresh_install, workspace.is_installed)
+    if name == 'install-hit':
+        return Scenario(['install', PACK_ID], 0, "Loaded from cache", prime_cache, workspace.is_installed)
+    if name == 'search':
+        return Scenario(['search', PACK_ID], 1, "Search Results")
+    if name == 'info-miss':
+        return Scenario(['info', PACK_ID], 1, "Links", workspace.clear_cache)
+    if name == 'info-hit':
+        return Scenario(['info', PACK_ID], 0, "Links", prime_cache)
+    if name == 'list':
+        return Scenario(['list'], 0, f"Total: {workspace.list_packs} packages", workspace.populate_packages)
+    if name == 'publish':
+        return Scenario(['publish', str(workspace.publish_dir)], 1, "Successfully published")
+    raise click.BadParameter(f"Unknown scenario {name}")
+
+def run_scenario(name, launcher, workspace, registry, iterations, warmup, payload_bytes):
+    scenario = make_scenario(name, workspace, launcher)
+    timings, rss = [], []
+    failures = 0
+    server_requests = 0
+
+    for i in range(warmup + iterations):
+        if scenario.setup:
+            scenario.setup()
+        requests_before = registry.requests
+        elapsed, peak_rss, exit_code, output = launcher.run(scenario.argv, workspace.env, workspace.project)
+        made = registry.requests - requests_before
+        if i < warmup:
+            continue
+        timings.append(elapsed)
+        rss.append(peak_rss)
+        server_requests += made
+        failures += not scenario.succeeded(exit_code, made, output)
+
+    counted_bytes = payload_bytes if name.startswith('install') else 0
+    return summarize(name, timings, rss, failures, counted_bytes, server_requests)
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def print_report(report):
+    table = Table(title=f"📊 pack.py benchmark ({report['config']['shape']}, {report['config']['pack_bytes'] / 1024:.0f} KB pack)")
+    table.add_column("Scenario", style="cyan")
+    table.add_column("p50", style="green", justify="right")
+    table.add_column("p90", style="yellow", justify="right")
+    table.add_column("p99", style="red", justify="right")
+    table.add_column("ops/s", justify="right")
+    table.add_column("MB/s", justify="right")
+    table.add_column("Peak RSS", justify="right")
+    table.add_column("Requests", style="dim", justify="right")
+    table.add_column("Failures", style="dim", justify="right")
+
+    for result in report['results']:
+        latency = result['latency_ms']
+        table.add_row(
+            result['scenario'],
+            f"{latency['p50']:.1f} ms",
+            f"{latency['p90']:.1f} ms",
+            f"{latency['p99']:.1f} ms",
+            f"{result['ops_per_sec']:.2f}",
+            f"{result['mb_per_sec']:.2f}" if result['mb_per_sec'] else "-",
+            f"{result['peak_rss_kb'] / 1024:.1f} MB",
+            str(result['server_requests']),
+            str(result['failures'])
+        )
+
+    console.print(table)
+
+def compare(report, baseline, threshold):
+    """Return scenarios whose p50 regressed by more than threshold versus baseline"""
+    previous = {r['scenario']: r for r in baseline.get('results', [])}
+    regressions = []
+    for result in report['results']:
+        before = previous.get(result['scenario'])
+        if not before:
+            continue
+        old, new = before['latency_ms']['p50'], result['latency_ms']['p50']
+        if old and (new - old) / old > threshold:
+            regressions.append((result['scenario'], old, new))
+    return regressions
+
+# ============================================================================
+# MAIN ENTRY POINT
+# ============================================================================
+
+@click.command()
+@click.option('--shape', type=click.Choice(['small', 'wasm', 'deep']), default='small', help='Shape of the generated pack')
+@click.option('--files', default=200, help='Number of files in the pack')
+@click.option('--file-size', default=2048, help='Size of each file in bytes (decoded)')
+@click.option('--depth', default=6, help='Directory depth for the deep shape')
+@click.option('--scenario', '-s', 'scenarios', multiple=True, type=click.Choice(SCENARIOS), help='Scenarios to run (default: all)')
+@click.option('--iterations', '-n', default=10, help='Timed runs per scenario')
+@click.option('--warmup', default=1, help='Untimed runs before each scenario')
+@click.option('--list-packs', default=20, help='Installed packs for the list scenario to scan')
+@click.option('--delay', default=0.0, help='Injected server latency per request, in seconds')
+@click.option('--output', '-o', type=click.Path(dir_okay=False), help='Write JSON results to this file')
+@click.option('--json', '-j', 'output_json', is_flag=True, help='Print JSON results instead of a table')
+@click.option('--baseline', type=click.Path(exists=True, dir_okay=False), help='Previous JSON results to compare against')
+@click.option('--threshold', default=0.10, help='Allowed p50 slowdown versus baseline (0.10 = 10%)')
+def main(shape, files, file_size, depth, scenarios, iterations, warmup, list_packs, delay, output, output_json, baseline, threshold):
+    """Benchmark pack.py commands against a local mock registry
+
+    Every command runs as a fresh process with an isolated HOME, so timings
+    include interpreter startup just like real invocations.
+
+    Examples:
+
+        python bench.py --shape wasm --files 4 --file-size 4000000
+        python bench.py -o results.json --baseline previous.json
+    """
+    # Must start before the pack is generated; see Launcher
+    launcher = Launcher()
+
+    pack_files = generate_files(shape, files, file_size, depth)
+    pack = make_pack(pack_files)
+    pack_bytes = sum(len(content) for content in pack_files.values())
+
+    with MockRegistry(pack, delay=delay) as registry:
+        workspace = Workspace(registry.url, pack_files, list_packs)
+        try:
+            results = [
+                run_scenario(name, launcher, workspace, registry, iterations, warmup, pack_bytes)
+                for name in (scenarios or SCENARIOS)
+            ]
+        finally:
+            workspace.cleanup()
+            launcher.close()
+
+    report = {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {
+            'shape': shape,
+            'files': files,
+            'file_size': file_size,
+            'depth': depth,
+            'iterations': iterations,
+            'warmup': warmup,
+            'list_packs': list_packs,
+            'delay': delay,
+            'pack_bytes': pack_bytes
+        },
+        'results': results
+    }
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if output_json:
+        click.echo(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    if any(result['failures'] for result in results):
+        err_console.print("[red]✗ Some benchmark runs failed; their timings don't measure the intended path[/red]")
+        sys.exit(1)
+
+    if baseline:
+        with open(baseline, encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), threshold)
+        if regressions:
+            for name, old, new in regressions:
+                err_console.print(f"[red]✗ {name}: p50 {old:.1f} ms → {new:.1f} ms[/red]")
+            sys.exit(1)
+        err_console.print("[green]✓ No regressions against baseline[/green]")
+
+if __name__ == '__main__':
+    main()
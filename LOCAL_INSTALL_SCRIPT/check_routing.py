@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# check_routing.py - Checks RegistryPool routing against local stand-in registries
+
+import os
+import sys
+import time
+import atexit
+import shutil
+import tempfile
+
+# pack.py creates ~/.pack on import; keep it out of the real home directory
+os.environ['HOME'] = tempfile.mkdtemp(prefix='pack-routing-')
+atexit.register(shutil.rmtree, os.environ['HOME'], ignore_errors=True)
+
+import click
+from rich.console import Console
+
+import pack
+from bench import MockRegistry, PACK_ID, generate_files, make_pack
+
+console = Console()
+
+# ============================================================================
+# SCENARIOS
+# ============================================================================
+
+def make_pool(primary, mirror, **config):
+    """A fresh RegistryPool over primary then mirror, with no persisted state"""
+    if pack.REGISTRY_STATE_FILE.exists():
+        pack.REGISTRY_STATE_FILE.unlink()
+    return pack.RegistryPool({**pack.DEFAULT_CONFIG, 'registry': primary.url, 'registries': [mirror.url], **config})
+
+def seed(pool, registry, path, latency, samples=10):
+    for _ in range(samples):
+        pool.record(registry.url, path, latency, True)
+
+def fetch(pool, path='/api/get-pack'):
+    start = time.monotonic()
+    response = pool.get(path, params={'id': PACK_ID})
+    return response, time.monotonic() - start
+
+def reset(*registries):
+    for registry in registries:
+        registry.delay = registry.body_delay = 0.0
+        registry.status = None
+        registry.requests = 0
+
+def check_within_p95(primary, mirror):
+    """A primary that answers inside its p95 is the only one asked"""
+    pool = make_pool(primary, mirror)
+    seed(pool, primary, '/api/get-pack', 0.2)
+    primary.delay = 0.05
+    response, _ = fetch(pool)
+    return response.status_code == 200 and primary.requests == 1 and mirror.requests == 0
+
+def check_hedge_after_p95(primary, mirror):
+    """A primary past its p95 gets a hedged duplicate, and the mirror wins"""
+    pool = make_pool(primary, mirror)
+    seed(pool, primary, '/api/get-pack', 0.1)
+    primary.delay = 1.0
+    response, elapsed = fetch(pool)
+    return (response.status_code == 200 and response.url.startswith(mirror.url)
+            and mirror.requests == 1 and 0.1 <= elapsed < 0.5)
+
+def check_windows_per_path(primary, mirror):
+    """Fast search samples don't set the hedge trigger for get-pack"""
+    pool = make_pool(primary, mirror)
+    seed(pool, primary, '/api/search', 0.005)
+    primary.delay = 0.3
+    response, _ = fetch(pool)
+    return response.status_code == 200 and mirror.requests == 0
+
+def check_probes_kept_out(primary, mirror):
+    """Fast health probes don't set the hedge trigger for get-pack"""
+    pool = make_pool(primary, mirror)
+    seed(pool, primary, pool.PROBE_WINDOW, 0.005)
+    primary.delay = 0.3
+    response, _ = fetch(pool)
+    return response.status_code == 200 and mirror.requests == 0
+
+def check_body_not_hedged(primary, mirror):
+    """A slow body download after fast headers is never hedged"""
+    pool = make_pool(primary, mirror)
+    seed(pool, primary, '/api/get-pack', 0.05)
+    primary.body_delay = 0.4
+    response, _ = fetch(pool)
+    return response.status_code == 200 and response.url.startswith(primary.url) and mirror.requests == 0
+
+def check_5xx_fails_over(primary, mirror):
+    """A 5xx from the primary fails over to the mirror"""
+    pool = make_pool(primary, mirror)
+    primary.status = 503
+    response, _ = fetch(pool)
+    return (response.status_code == 200 and response.url.startswith(mirror.url)
+            and primary.requests == 1 and mirror.requests == 1)
+
+def check_4xx_returned(primary, mirror):
+    """A 4xx from the primary is authoritative and returned as-is"""
+    pool = make_pool(primary, mirror)
+    primary.status = 404
+    response, _ = fetch(pool)
+    return response.status_code == 404 and primary.requests == 1 and mirror.requests == 0
+
+CHECKS = (
+    check_within_p95,
+    check_hedge_after_p95,
+    check_windows_per_path,
+    check_probes_kept_out,
+    check_body_not_hedged,
+    check_5xx_fails_over,
+    check_4xx_returned
+)
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+@click.command()
+def main():
+    """Check hedging and failover in pack.py's RegistryPool
+
+    Runs a fast and a slow stand-in registry with injected delays and
+    status codes, and exits non-zero if any check fails.
+    """
+    pack_data = make_pack(generate_files('wasm', 2, 200000, 1))
+    failures = 0
+
+    with MockRegistry(pack_data) as primary, MockRegistry(pack_data) as mirror:
+        for check in CHECKS:
+            reset(primary, mirror)
+            ok = check(primary, mirror)
+            # Let losing hedged attempts finish before the next check resets counters
+            time.sleep(1.1)
+            failures += not ok
+            mark = "[green]✓[/green]" if ok else "[red]✗[/red]"
+            console.print(f"{mark} {check.__doc__}")
+
+    if failures:
+        console.print(f"\n[red]✗ {failures} routing checks failed[/red]")
+        sys.exit(1)
+    console.print("\n[green]✓ All routing checks passed[/green]")
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,95 @@
 #!/usr/bin/env python3
 # pack.py - Complete Python CLI client for PackCDN
 
-import click
-import requests
 import json
 import os
 import sys
+import socket
+import time
+
+_process_start = time.perf_counter()
+
+# ============================================================================
+# DAEMON FAST PATH - RUNS BEFORE THE HEAVY IMPORTS BELOW
+# ============================================================================
+
+DAEMON_SOCKET = os.path.join(os.path.expanduser('~'), '.pack', 'daemon.sock')
+DAEMON_COMMANDS = ('info', 'search')
+# Past this, a wedged daemon is abandoned and the command runs in-process;
+# override with PACK_DAEMON_TIMEOUT
+DAEMON_TIMEOUT = 10.0
+
+def forward_to_daemon(argv):
+    """Run argv on a running `pack daemon` and return its exit code
+    
+    Returns None when the command can't be forwarded or no daemon is
+    listening, in which case the caller runs the command in-process.
+    """
+    if not argv or argv[0] not in DAEMON_COMMANDS or '--help' in argv:
+        return None
+    if os.environ.get('PACK_NO_DAEMON') or not hasattr(socket, 'AF_UNIX'):
+        return None
+    
+    try:
+        timeout = float(os.environ.get('PACK_DAEMON_TIMEOUT', DAEMON_TIMEOUT))
+    except ValueError:
+        timeout = DAEMON_TIMEOUT
+    
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.settimeout(0.5)
+        client.connect(DAEMON_SOCKET)
+        client.settimeout(timeout)
+        
+        import shutil
+        request = {
+            'op': 'run',
+            'argv': argv,
+            'width': shutil.get_terminal_size().columns,
+            'color': sys.stdout.isatty()
+        }
+        client.sendall(json.dumps(request).encode() + b'\n')
+        
+        chunks = []
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        reply = json.loads(b''.join(chunks))
+    except (OSError, ValueError):
+        return None
+    finally:
+        client.close()
+    
+    sys.stdout.write(reply.get('output', ''))
+    sys.stdout.flush()
+    return reply.get('exit_code', 0)
+
+if __name__ == '__main__':
+    exit_code = forward_to_daemon(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+import click
+import requests
 import hashlib
 import base64
+import io
+import mmap
+import struct
+import zlib
+import socketserver
+import subprocess
 from pathlib import Path
 import shutil
 import tarfile
+import threading
+import queue
+import atexit
+import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 from rich.console import Console
 from rich.table import Table
@@ -26,6 +105,10 @@ CONFIG_DIR = Path.home() / ".pack"
 INSTALL_DIR = CONFIG_DIR / "packages"
 CACHE_DIR = CONFIG_DIR / "cache"
 CONFIG_FILE = CONFIG_DIR / "config.json"
+REGISTRY_STATE_FILE = CONFIG_DIR / "registries.json"
+STATS_FILE = CONFIG_DIR / "stats.json"
+TRASH_INDEX_FILE = CONFIG_DIR / "trash.json"
+TRASH_DIRNAME = ".pack-trash"
 
 # Create directories
 CONFIG_DIR.mkdir(exist_ok=True)
@@ -40,29 +123,907 @@ DEFAULT_CONFIG = {
     "api_key": None,
     "username": None,
     "cache_enabled": True,
-    "cache_ttl": 3600
+    "cache_ttl": 3600,
+    "registries": [],
+    "hedge_requests": True,
+    "hedge_delay": 0.5,
+    "request_timeout": 30,
+    "health_check_interval": 300,
+    "telemetry_enabled": False,
+    "telemetry_textfile": None
 }
 
+_config_cache = (None, None)
+
 def load_config():
-    """Load configuration from file"""
+    """Load configuration from file
+    
+    The parsed file is kept until its mtime changes, so a long-running
+    daemon doesn't re-read it on every command.
+    """
+    global _config_cache
     if CONFIG_FILE.exists():
-        with open(CONFIG_FILE) as f:
-            return {**DEFAULT_CONFIG, **json.load(f)}
-    return DEFAULT_CONFIG
+        mtime = CONFIG_FILE.stat().st_mtime_ns
+        if _config_cache[0] != mtime:
+            with tracer.span('config.load'):
+                with open(CONFIG_FILE) as f:
+                    _config_cache = (mtime, json.load(f))
+        return {**DEFAULT_CONFIG, **_config_cache[1]}
+    return dict(DEFAULT_CONFIG)
 
 def save_config(config):
     """Save configuration to file"""
     with open(CONFIG_FILE, 'w') as f:
         json.dump(config, f, indent=2)
 
+def write_atomic(path, data):
+    """Write data to path via a temp file and rename, so readers never see a partial file
+    
+    data is a str, bytes, or a list of bytes chunks written in order.
+    """
+    chunks = [data] if isinstance(data, (str, bytes)) else data
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        if isinstance(data, str):
+            f = os.fdopen(fd, 'w', encoding='utf-8')
+        else:
+            f = os.fdopen(fd, 'wb')
+        with f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+# ============================================================================
+# TRACING - NESTED TIMING SPANS FOR --trace
+# ============================================================================
+
+class Tracer:
+    """Records nested timing spans and byte counts for `pack --trace`
+    
+    Spans are no-ops until enable() is called. Each span yields a dict that
+    the caller can add args to (e.g. bytes) before it closes.
+    """
+    
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self.lock = threading.Lock()
+        self.local = threading.local()
+    
+    def enable(self):
+        self.enabled = True
+        # Everything before the CLI callback runs is interpreter startup and imports
+        self.add('startup', _process_start, time.perf_counter(), 0, {})
+        self.instrument_network()
+    
+    def add(self, name, start, end, depth, args):
+        with self.lock:
+            self.events.append({
+                'name': name,
+                'start': start,
+                'end': end,
+                'depth': depth,
+                'tid': threading.get_ident(),
+                'args': args
+            })
+    
+    @contextmanager
+    def span(self, name, **args):
+        if not self.enabled:
+            yield args
+            return
+        depth = self.depth()
+        self.local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            self.local.depth = depth
+            self.add(name, start, time.perf_counter(), depth, args)
+    
+    def depth(self):
+        return getattr(self.local, 'depth', 0)
+    
+    def set_depth(self, depth):
+        """Nest spans from a worker thread under the span that started it"""
+        self.local.depth = depth
+    
+    def wrap(self, name, func):
+        def traced(*args, **kwargs):
+            with self.span(name):
+                return func(*args, **kwargs)
+        return traced
+    
+    def instrument_network(self):
+        """Split HTTP time into DNS, TCP connect and TLS handshake spans"""
+        import urllib3.connection
+        import urllib3.util.connection
+        
+        socket.getaddrinfo = self.wrap('net.dns', socket.getaddrinfo)
+        urllib3.util.connection.create_connection = self.wrap('net.connect', urllib3.util.connection.create_connection)
+        # Name differs across urllib3 releases; skip TLS timing if neither exists
+        for attr in ('_ssl_wrap_socket_and_match_hostname', 'ssl_wrap_socket'):
+            if hasattr(urllib3.connection, attr):
+                setattr(urllib3.connection, attr, self.wrap('net.tls', getattr(urllib3.connection, attr)))
+                break
+    
+    def write_chrome(self, path):
+        """Write spans as Chrome trace / Perfetto JSON"""
+        pid = os.getpid()
+        events = [{
+            'name': event['name'],
+            'cat': 'pack',
+            'ph': 'X',
+            'ts': (event['start'] - _process_start) * 1e6,
+            'dur': (event['end'] - event['start']) * 1e6,
+            'pid': pid,
+            'tid': event['tid'],
+            'args': event['args']
+        } for event in self.events]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+    
+    def print_summary(self):
+        """Print spans aggregated by name, in first-seen order"""
+        totals = {}
+        for event in sorted(self.events, key=lambda e: e['start']):
+            entry = totals.setdefault(event['name'], {'calls': 0, 'ms': 0.0, 'bytes': 0, 'depth': event['depth']})
+            entry['calls'] += 1
+            entry['ms'] += (event['end'] - event['start']) * 1000
+            entry['bytes'] += event['args'].get('bytes', 0)
+            entry['depth'] = min(entry['depth'], event['depth'])
+        
+        table = Table(title="⏱ Trace")
+        table.add_column("Span", style="cyan")
+        table.add_column("Calls", style="dim", justify="right")
+        table.add_column("Total", style="green", justify="right")
+        table.add_column("Bytes", style="yellow", justify="right")
+        
+        for name, entry in totals.items():
+            table.add_row(
+                "  " * entry['depth'] + name,
+                str(entry['calls']),
+                f"{entry['ms']:.1f} ms",
+                f"{entry['bytes'] / 1024:.1f} KB" if entry['bytes'] else "-"
+            )
+        
+        Console(stderr=True).print(table)
+    
+    def report(self, summary, path):
+        if path:
+            self.write_chrome(path)
+            Console(stderr=True).print(f"[dim]Trace written to {path}[/dim]")
+        if summary:
+            self.print_summary()
+
+tracer = Tracer()
+
+# ============================================================================
+# TELEMETRY - LOCAL, OPT-IN COUNTERS ACROSS INVOCATIONS
+# ============================================================================
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+class Telemetry:
+    """Cumulative cache and request statistics, persisted in STATS_FILE
+    
+    Disabled unless config['telemetry_enabled'] is set. Each process keeps
+    deltas in memory and merges them into STATS_FILE on flush(), under a
+    file lock so concurrent invocations don't lose updates. If
+    config['telemetry_textfile'] is set, a Prometheus textfile-collector
+    file is rewritten on every flush.
+    """
+    
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    COUNTERS = (
+        'cache_hits',
+        'cache_misses',
+        'cache_revalidations',
+        'cache_corrupt',
+        'bytes_downloaded',
+        'bytes_from_cache',
+        'bytes_uploaded'
+    )
+    
+    def __init__(self):
+        self.enabled = False
+        self.textfile = None
+        self.lock = threading.Lock()
+        self.pending = self.empty()
+    
+    def empty(self):
+        return {
+            'since': datetime.now().isoformat(timespec='seconds'),
+            'counters': {name: 0 for name in self.COUNTERS},
+            'requests': {}
+        }
+    
+    def enable(self, config):
+        if not self.enabled:
+            self.enabled = True
+            atexit.register(self.flush)
+        self.textfile = config.get('telemetry_textfile')
+    
+    def count(self, name, value=1):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.pending['counters'][name] += value
+    
+    def observe_request(self, registry, path, seconds, nbytes, ok):
+        """Record one HTTP request against a registry endpoint"""
+        if not self.enabled:
+            return
+        key = f"{registry} {path}"
+        with self.lock:
+            entry = self.pending['requests'].setdefault(key, self.empty_histogram())
+            entry['count'] += 1
+            entry['sum'] += seconds
+            entry['errors'] += not ok
+            entry['buckets'][self.bucket_index(seconds)] += 1
+            if ok:
+                self.pending['counters']['bytes_downloaded'] += nbytes
+    
+    def empty_histogram(self):
+        return {'count': 0, 'errors': 0, 'sum': 0.0, 'buckets': [0] * (len(self.BUCKETS) + 1)}
+    
+    def bucket_index(self, seconds):
+        for i, bound in enumerate(self.BUCKETS):
+            if seconds <= bound:
+                return i
+        return len(self.BUCKETS)
+    
+    def load(self):
+        if STATS_FILE.exists():
+            try:
+                with open(STATS_FILE, encoding='utf-8') as f:
+                    stats = json.load(f)
+                stats['counters'] = {**self.empty()['counters'], **stats.get('counters', {})}
+                stats.setdefault('requests', {})
+                return stats
+            except (OSError, ValueError):
+                pass
+        return self.empty()
+    
+    def merge(self, stats, delta):
+        for name, value in delta['counters'].items():
+            stats['counters'][name] = stats['counters'].get(name, 0) + value
+        for key, entry in delta['requests'].items():
+            total = stats['requests'].setdefault(key, self.empty_histogram())
+            total['count'] += entry['count']
+            total['errors'] += entry['errors']
+            total['sum'] += entry['sum']
+            total['buckets'] = [a + b for a, b in zip(total['buckets'], entry['buckets'])]
+        return stats
+    
+    @contextmanager
+    def locked(self):
+        with open(CONFIG_DIR / "stats.lock", 'w') as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+    
+    def write(self, stats):
+        write_atomic(STATS_FILE, json.dumps(stats))
+        
+        if self.textfile:
+            # Atomic so node_exporter never reads a partial file
+            write_atomic(Path(self.textfile), self.prometheus(stats))
+    
+    def flush(self):
+        """Merge this process's deltas into STATS_FILE"""
+        with self.lock:
+            delta, self.pending = self.pending, self.empty()
+        if not self.enabled or not (any(delta['counters'].values()) or delta['requests']):
+            return
+        try:
+            with self.locked():
+                self.write(self.merge(self.load(), delta))
+        except OSError:
+            pass
+    
+    def reset(self):
+        with self.locked():
+            self.write(self.empty())
+    
+    def prometheus(self, stats):
+        """Render stats in the Prometheus text exposition format"""
+        lines = []
+        help_text = {
+            'cache_hits': 'Installs and info lookups served from the local cache',
+            'cache_misses': 'Installs and info lookups with no usable cache entry',
+            'cache_revalidations': 'Installs and info lookups that refetched an expired cache entry',
+            'cache_corrupt': 'Cache entries dropped and refetched because a payload was corrupt',
+            'bytes_downloaded': 'Response bytes downloaded from registries',
+            'bytes_from_cache': 'Registry response bytes served from the local cache instead',
+            'bytes_uploaded': 'Archive bytes uploaded by publish'
+        }
+        for name in self.COUNTERS:
+            # Prometheus puts the unit last: bytes_downloaded -> pack_downloaded_bytes_total
+            metric = f"pack_{name[len('bytes_'):]}_bytes_total" if name.startswith('bytes_') else f"pack_{name}_total"
+            lines.append(f"# HELP {metric} {help_text[name]}")
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {stats['counters'].get(name, 0)}")
+        
+        lines.append("# HELP pack_request_errors_total Failed registry requests")
+        lines.append("# TYPE pack_request_errors_total counter")
+        for key, entry in sorted(stats['requests'].items()):
+            registry, path = key.split(' ', 1)
+            lines.append(f'pack_request_errors_total{{registry="{registry}",endpoint="{path}"}} {entry["errors"]}')
+        
+        lines.append("# HELP pack_request_duration_seconds Registry request latency")
+        lines.append("# TYPE pack_request_duration_seconds histogram")
+        for key, entry in sorted(stats['requests'].items()):
+            registry, path = key.split(' ', 1)
+            labels = f'registry="{registry}",endpoint="{path}"'
+            cumulative = 0
+            for bound, count in zip(self.BUCKETS + ('+Inf',), entry['buckets']):
+                cumulative += count
+                lines.append(f'pack_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"pack_request_duration_seconds_sum{{{labels}}} {entry['sum']:.6f}")
+            lines.append(f"pack_request_duration_seconds_count{{{labels}}} {entry['count']}")
+        
+        return "\n".join(lines) + "\n"
+    
+    def quantile(self, entry, q):
+        """Estimate a latency quantile as the upper bound of its histogram bucket"""
+        if not entry['count']:
+            return None
+        target = q * entry['count']
+        cumulative = 0
+        for bound, count in zip(self.BUCKETS + (float('inf'),), entry['buckets']):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+        return float('inf')
+
+telemetry = Telemetry()
+
+# ============================================================================
+# CACHE FORMAT - VERSIONED BINARY ENTRIES WITH PER-FILE COMPRESSION
+# ============================================================================
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+CACHE_SUFFIX = ".pkc"
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+class CacheFormatError(Exception):
+    """Raised for cache entries that are corrupt or can't be decoded here"""
+
+# Everything decompress() and decoding a payload can raise for corrupt input
+CODEC_ERRORS = (zlib.error, ValueError) + ((zstandard.ZstdError,) if zstandard else ())
+
+def compress(data, codec):
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data, 6)
+
+def decompress(data, codec):
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise CacheFormatError("entry is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+def decode_pack_files(files):
+    """Yield (filename, kind, prefix, payload) for get-pack file contents
+    
+    data: URLs are base64-decoded to bytes (kind 'data', prefix is the part
+    before the comma), strings stay str (kind 'text') and anything else is
+    kept as JSON text (kind 'json').
+    """
+    for filename, content in (files or {}).items():
+        if isinstance(content, str):
+            if content.startswith('data:'):
+                prefix, content_data = content.split(',', 1)
+                with tracer.span('base64.decode', bytes=len(content_data)):
+                    decoded = base64.b64decode(content_data)
+                yield filename, 'data', prefix, decoded
+            else:
+                yield filename, 'text', None, content
+        else:
+            yield filename, 'json', None, json.dumps(content)
+
+def write_pack_file(file_path, kind, payload):
+    """Write one decoded pack file, returning the number of bytes/chars written"""
+    if kind == 'data':
+        with open(file_path, 'wb') as f:
+            return f.write(payload)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        return f.write(payload)
+
+class CacheEntry:
+    """A cached get-pack response in CACHE_DIR
+    
+    Layout: fixed header, compressed metadata JSON, then each file payload
+    compressed on its own. The metadata holds the response with file
+    contents replaced by a table of offsets, so it can be read without
+    touching any payload, and payloads are decoded one at a time. Large
+    entries are memory-mapped rather than read into memory.
+    """
+    
+    MAGIC = b'PKC'
+    VERSION = 1
+    # magic, format version, codec, reserved, compressed metadata length
+    HEADER = struct.Struct('<3sBBxxxQ')
+    MMAP_THRESHOLD = 1024 * 1024
+    
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        try:
+            size = os.fstat(self.file.fileno()).st_size
+            if size >= self.MMAP_THRESHOLD:
+                self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self.buffer = self.file.read()
+            
+            if size < self.HEADER.size:
+                raise CacheFormatError("truncated header")
+            magic, version, self.codec, meta_length = self.HEADER.unpack_from(self.buffer, 0)
+            if magic != self.MAGIC or version != self.VERSION:
+                raise CacheFormatError(f"unsupported cache entry (version {version})")
+            
+            meta_end = self.HEADER.size + meta_length
+            if meta_end > size:
+                raise CacheFormatError("truncated metadata")
+            try:
+                self.metadata = json.loads(decompress(self.buffer[self.HEADER.size:meta_end], self.codec))
+            except CODEC_ERRORS as e:
+                raise CacheFormatError(f"corrupt metadata: {e}")
+            if not (isinstance(self.metadata, dict) and isinstance(self.metadata.get('response'), dict)
+                    and isinstance(self.metadata.get('files'), list)):
+                raise CacheFormatError("corrupt metadata")
+            self.size = size
+            self.payload_start = meta_end
+        except Exception:
+            self.close()
+            raise
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def close(self):
+        if isinstance(getattr(self, 'buffer', None), mmap.mmap):
+            self.buffer.close()
+        self.file.close()
+    
+    @property
+    def data(self):
+        """The get-pack response, with pack['files'] mapping names to sizes"""
+        return self.metadata['response']
+    
+    @property
+    def response_size(self):
+        """Length of the registry response body this entry stands in for"""
+        return self.metadata.get('response_size', 0)
+    
+    def iter_files(self):
+        """Yield (filename, kind, prefix, payload) like decode_pack_files()
+        
+        Payloads are only decoded here, so a corrupt one raises
+        CacheFormatError partway through iteration.
+        """
+        for entry in self.metadata['files']:
+            try:
+                start = self.payload_start + entry['offset']
+                end = start + entry['length']
+                if end > self.size:
+                    raise CacheFormatError(f"truncated payload for {entry['name']}")
+                raw = decompress(self.buffer[start:end], self.codec)
+                if len(raw) != entry['size']:
+                    raise CacheFormatError(f"size mismatch for {entry['name']}")
+                if entry['kind'] == 'data':
+                    item = entry['name'], 'data', entry['prefix'], raw
+                else:
+                    item = entry['name'], entry['kind'], None, raw.decode('utf-8')
+            except CODEC_ERRORS + (KeyError, TypeError) as e:
+                raise CacheFormatError(f"corrupt payload: {e}")
+            yield item
+    
+    @classmethod
+    def write(cls, path, data, files, response_size):
+        """Write data with the decoded files from decode_pack_files() to path
+        
+        response_size is the length of the registry response body, so that
+        cache hits can be compared with bytes downloaded in telemetry.
+        """
+        codec = CODEC_ZSTD if zstandard else CODEC_ZLIB
+        table, payloads, offset = [], [], 0
+        sizes = {}
+        
+        for filename, kind, prefix, payload in files:
+            raw = payload if kind == 'data' else payload.encode('utf-8')
+            blob = compress(raw, codec)
+            table.append({
+                'name': filename,
+                'kind': kind,
+                'prefix': prefix,
+                'offset': offset,
+                'length': len(blob),
+                'size': len(raw)
+            })
+            sizes[filename] = len(raw)
+            payloads.append(blob)
+            offset += len(blob)
+        
+        response = dict(data)
+        if isinstance(response.get('pack'), dict):
+            response['pack'] = {**response['pack'], 'files': sizes}
+        metadata = compress(json.dumps({'response': response, 'response_size': response_size, 'files': table}).encode('utf-8'), codec)
+        
+        header = cls.HEADER.pack(cls.MAGIC, cls.VERSION, codec, len(metadata))
+        write_atomic(path, [header, metadata] + payloads)
+        return cls.HEADER.size + len(metadata) + offset
+
+def cache_path(package_id, package_version=None):
+    cache_key = f"{package_id}_{package_version or 'latest'}"
+    return CACHE_DIR / f"{hashlib.md5(cache_key.encode()).hexdigest()}{CACHE_SUFFIX}"
+
+def open_cache_entry(cache_file, config):
+    """Return the CacheEntry at cache_file if it exists and is within cache_ttl, else None"""
+    if not cache_file.exists():
+        return None
+    cache_age = datetime.now().timestamp() - cache_file.stat().st_mtime
+    if cache_age >= config.get('cache_ttl', 3600):
+        return None
+    try:
+        return CacheEntry(cache_file)
+    except (OSError, CacheFormatError):
+        return None
+
+# ============================================================================
+# REGISTRY ROUTING - LATENCY-AWARE MIRROR SELECTION WITH HEDGED REQUESTS
+# ============================================================================
+
+class ResponseMemo:
+    """Bounded in-memory LRU of registry responses, used by the daemon
+    
+    Entries expire after ttl seconds and the least recently used are evicted
+    once either max_entries or max_bytes (of response bodies) is exceeded.
+    """
+    
+    def __init__(self, ttl, max_entries=256, max_bytes=64 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def _drop(self, key):
+        _, response = self.entries.pop(key)
+        self.size -= len(response.content)
+    
+    def get(self, key):
+        with self.lock:
+            hit = self.entries.get(key)
+            if hit is None:
+                return None
+            if time.monotonic() - hit[0] >= self.ttl:
+                self._drop(key)
+                return None
+            self.entries.move_to_end(key)
+            return hit[1]
+    
+    def put(self, key, response):
+        if len(response.content) > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self._drop(key)
+            now = time.monotonic()
+            for expired in [k for k, (stored, _) in self.entries.items() if now - stored >= self.ttl]:
+                self._drop(expired)
+            self.entries[key] = (now, response)
+            self.size += len(response.content)
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                self._drop(next(iter(self.entries)))
+
+class RegistryPool:
+    """Routes registry reads to the fastest healthy endpoint
+
+    Endpoints are config['registry'] followed by config['registries'], in
+    order. Latency samples and failures are persisted in REGISTRY_STATE_FILE
+    so routing decisions carry over between invocations. If the first
+    endpoint has not started answering by its p95 time-to-first-byte for
+    that path, a hedged duplicate is sent to the next one and whichever
+    answers first wins.
+    
+    Samples are kept per path, and health probes in their own window, so
+    that fast endpoints like search never set the hedge trigger for
+    get-pack. Only time-to-first-byte is sampled; once a response has
+    started, its body download is never hedged.
+    """
+
+    LATENCY_WINDOW = 50
+    PROBE_WINDOW = 'HEAD /'
+    MIN_SAMPLES = 5
+    FAILURE_COOLDOWN = 60
+    # Only package metadata is memoized; search results always come fresh,
+    # matching what the same command does without the daemon
+    MEMO_PATHS = ('/api/get-pack',)
+
+    def __init__(self, config, memoize=False):
+        self.config = config
+        self.memo = ResponseMemo(config.get('cache_ttl', 3600)) if memoize else None
+        self.urls = []
+        for url in [config['registry']] + list(config.get('registries') or []):
+            url = url.rstrip('/')
+            if url not in self.urls:
+                self.urls.append(url)
+        self.session = requests.Session()
+        self.lock = threading.Lock()
+        self.state = self._load_state()
+
+    def _load_state(self):
+        state = {}
+        if REGISTRY_STATE_FILE.exists():
+            try:
+                with open(REGISTRY_STATE_FILE, encoding='utf-8') as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = {}
+        result = {}
+        for url in self.urls:
+            entry = state.get(url, {'latencies': {}, 'failures': 0, 'down_until': 0, 'checked_at': 0})
+            if not isinstance(entry.get('latencies'), dict):
+                # Older state files mixed every path into a single window
+                entry['latencies'] = {}
+            result[url] = entry
+        return result
+
+    def save_state(self):
+        with self.lock:
+            snapshot = json.dumps(self.state)
+        try:
+            # Saved from the health-check thread and concurrent pack processes too
+            write_atomic(REGISTRY_STATE_FILE, snapshot)
+        except OSError:
+            pass
+
+    def record(self, url, window, latency, ok):
+        """Record the outcome of a request against an endpoint
+        
+        window is the request path, or PROBE_WINDOW for health probes.
+        """
+        with self.lock:
+            entry = self.state[url]
+            entry['checked_at'] = time.time()
+            if ok:
+                samples = entry['latencies'].get(window, [])
+                entry['latencies'][window] = (samples + [round(latency, 4)])[-self.LATENCY_WINDOW:]
+                entry['failures'] = 0
+                entry['down_until'] = 0
+            else:
+                entry['failures'] += 1
+                entry['down_until'] = time.time() + self.FAILURE_COOLDOWN * min(entry['failures'], 10)
+
+    def samples(self, url, window):
+        return self.state[url]['latencies'].get(window, [])
+
+    def percentile(self, url, pct, window):
+        latencies = sorted(self.samples(url, window))
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(round(pct / 100 * (len(latencies) - 1))))]
+
+    def is_healthy(self, url):
+        return self.state[url]['down_until'] <= time.time()
+
+    def ranked(self, path=None):
+        """Endpoints ordered healthy-first, then by median latency, then config order
+        
+        Latency is taken from path's window where there is one, else from
+        health probes.
+        """
+        def score(item):
+            index, url = item
+            median = self.percentile(url, 50, path) if path else None
+            if median is None:
+                median = self.percentile(url, 50, self.PROBE_WINDOW)
+            # Unmeasured endpoints rank as if they answered at the hedge delay
+            # so that new mirrors get tried without jumping ahead of known-fast ones
+            return (not self.is_healthy(url), median if median is not None else self.config.get('hedge_delay', 0.5), index)
+        return [url for _, url in sorted(enumerate(self.urls), key=score)]
+
+    def hedge_delay(self, url, path):
+        if len(self.samples(url, path)) >= self.MIN_SAMPLES:
+            return self.percentile(url, 95, path)
+        return self.config.get('hedge_delay', 0.5)
+
+    def get(self, path, **kwargs):
+        """GET path from the best endpoint, hedging and failing over as needed
+
+        Returns the first response that is not a 5xx. 4xx responses are
+        authoritative and returned as-is. Raises the last RequestException if
+        every endpoint failed.
+        """
+        kwargs.setdefault('timeout', self.config.get('request_timeout', 30))
+        
+        memo_key = None
+        if (self.memo is not None and path in self.MEMO_PATHS
+                and 'no_cache' not in (kwargs.get('params') or {})):
+            memo_key = json.dumps([path, kwargs.get('params')], sort_keys=True, default=str)
+            hit = self.memo.get(memo_key)
+            if hit is not None:
+                return hit
+        
+        candidates = self.ranked(path)
+        # Attempts report twice: (url, None, None) once headers are in, then
+        # (url, response, error) when done
+        results = queue.Queue()
+        done = threading.Event()
+        trace_depth = tracer.depth()
+
+        def attempt(url):
+            tracer.set_depth(trace_depth)
+            start = time.monotonic()
+            with tracer.span('http.get', endpoint=url, path=path) as span:
+                try:
+                    response = self.session.get(f"{url}{path}", stream=True, **kwargs)
+                    ok = response.status_code < 500
+                    self.record(url, path, response.elapsed.total_seconds(), ok)
+                    if ok:
+                        results.put((url, None, None))
+                    if done.is_set():
+                        # Another endpoint already won; don't download this body too
+                        response.close()
+                        return
+                    content = response.content
+                except requests.exceptions.RequestException as e:
+                    span['error'] = str(e)
+                    self.record(url, path, time.monotonic() - start, False)
+                    telemetry.observe_request(url, path, time.monotonic() - start, 0, False)
+                    results.put((url, None, e))
+                    return
+                span['status'] = response.status_code
+                span['bytes'] = len(content)
+                span['ttfb_ms'] = response.elapsed.total_seconds() * 1000
+            telemetry.observe_request(url, path, time.monotonic() - start, len(content), ok)
+            results.put((url, response, None))
+
+        def launch():
+            url = candidates.pop(0)
+            threading.Thread(target=attempt, args=(url,), daemon=True).start()
+            return url
+
+        current = launch()
+        pending = 1
+        streaming = set()
+        last_response, last_error = None, None
+
+        try:
+            while pending:
+                timeout = None
+                if candidates and not streaming and self.config.get('hedge_requests', True):
+                    timeout = self.hedge_delay(current, path)
+                try:
+                    url, response, error = results.get(timeout=timeout)
+                except queue.Empty:
+                    # First request is past its p95 with no headers yet; fire a hedged duplicate
+                    current = launch()
+                    pending += 1
+                    continue
+
+                if response is None and error is None:
+                    # Headers are in; wait for the body rather than hedging it
+                    streaming.add(url)
+                    continue
+                
+                streaming.discard(url)
+                pending -= 1
+                if error is None and response.status_code < 500:
+                    done.set()
+                    if memo_key and response.status_code == 200:
+                        self.memo.put(memo_key, response)
+                    return response
+
+                if response is not None:
+                    last_response = response
+                if error is not None:
+                    last_error = error
+                if candidates:
+                    current = launch()
+                    pending += 1
+        finally:
+            self.save_state()
+
+        if last_response is not None:
+            return last_response
+        raise last_error
+
+    def probe(self, url):
+        """Measure a single endpoint with a lightweight HEAD request"""
+        start = time.monotonic()
+        try:
+            response = self.session.head(url, timeout=5, allow_redirects=True)
+            self.record(url, self.PROBE_WINDOW, time.monotonic() - start, response.status_code < 500)
+        except requests.exceptions.RequestException:
+            self.record(url, self.PROBE_WINDOW, time.monotonic() - start, False)
+
+    def check_health(self, force=False):
+        """Probe endpoints whose health data is older than health_check_interval"""
+        interval = self.config.get('health_check_interval', 300)
+        stale = [url for url in self.urls
+                 if force or time.time() - self.state[url]['checked_at'] > interval]
+        threads = [threading.Thread(target=self.probe, args=(url,), daemon=True) for url in stale]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if stale:
+            self.save_state()
+
+    def start_health_check(self):
+        """Refresh stale health data in the background without blocking the caller"""
+        if len(self.urls) > 1:
+            threading.Thread(target=self.check_health, daemon=True).start()
+
+_registry_pool = None
+_daemon_mode = False
+
+def registry_pool(config):
+    """Return the shared RegistryPool for config, creating it on first use"""
+    global _registry_pool
+    if _registry_pool is None or _registry_pool.config != config:
+        _registry_pool = RegistryPool(config, memoize=_daemon_mode)
+        _registry_pool.start_health_check()
+    return _registry_pool
+
+def current_console():
+    """Console for the running command
+    
+    The daemon runs commands concurrently and passes each one its own
+    capturing Console through ctx.obj; otherwise this is the global console.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx and isinstance(ctx.obj, dict) and ctx.obj.get('console'):
+        return ctx.obj['console']
+    return console
+
 @click.group()
-def cli():
+@click.option('--trace', is_flag=True, help='Print a per-phase timing summary to stderr')
+@click.option('--trace-file', type=click.Path(dir_okay=False), help='Write per-phase timings as Chrome trace / Perfetto JSON')
+@click.pass_context
+def cli(ctx, trace, trace_file):
     """PackCDN Package Manager - Ultimate Package Distribution
     
     A modern package manager with WebAssembly support, private packages,
     and global CDN delivery.
     """
-    pass
+    # Enabled first so the config load below is traced rather than lumped into startup
+    if trace or trace_file:
+        tracer.enable()
+        # Resources close in reverse order, so the command span ends before the report
+        ctx.call_on_close(lambda: tracer.report(trace, trace_file))
+        ctx.with_resource(tracer.span(ctx.invoked_subcommand or 'pack'))
+    
+    config = load_config()
+    if config.get('telemetry_enabled'):
+        telemetry.enable(config)
+    
+    # Reclaim space from removals that an earlier run didn't finish deleting
+    if TRASH_INDEX_FILE.exists() and ctx.invoked_subcommand != 'trash':
+        empty_trash_in_background()
 
 # ============================================================================
 # INSTALL COMMAND - UPDATED TO USE CORRECT API ENDPOINT
@@ -103,6 +1064,7 @@ def install(package_spec, version, global_install, save, save_dev, force, no_cac
         
         # Task 1: Fetch package info from API
         task1 = progress.add_task(f"🔍 Fetching {package_id}...", total=None)
+        entry = None
         
         try:
             # Use the API endpoint that returns JSON
@@ -113,42 +1075,47 @@ def install(package_spec, version, global_install, save, save_dev, force, no_cac
                 params['no_cache'] = '1'
             
             # Check cache first
-            cache_key = f"{package_id}_{package_version or 'latest'}"
-            cache_file = CACHE_DIR / f"{hashlib.md5(cache_key.encode()).hexdigest()}.json"
+            cache_file = cache_path(package_id, package_version)
             
+            entry = None
+            cache_event = 'cache_misses'
             if cache_file.exists() and not no_cache and not force:
-                cache_age = datetime.now().timestamp() - cache_file.stat().st_mtime
-                if cache_age < config.get('cache_ttl', 3600):
-                    with open(cache_file, encoding='utf-8') as f:
-                        data = json.load(f)
+                with tracer.span('cache.read', bytes=cache_file.stat().st_size):
+                    entry = open_cache_entry(cache_file, config)
+                if entry:
+                    cache_event = 'cache_hits'
+                    telemetry.count('bytes_from_cache', entry.response_size)
                     progress.update(task1, completed=True)
                     console.print("[dim]📦 Loaded from cache[/dim]")
                 else:
-                    # Cache expired, fetch fresh
-                    response = requests.get(
-                        f"{config['registry']}/api/get-pack",
-                        params=params,
-                        headers={'Accept': 'application/json'}
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-                    with open(cache_file, 'w', encoding='utf-8') as f:
-                        json.dump(data, f)
-                    progress.update(task1, completed=True)
-            else:
-                # Fetch fresh
-                response = requests.get(
-                    f"{config['registry']}/api/get-pack",
+                    cache_event = 'cache_revalidations'
+            telemetry.count(cache_event)
+            
+            def fetch():
+                """Fetch get-pack from the registry, caching it if enabled"""
+                response = registry_pool(config).get(
+                    "/api/get-pack",
                     params=params,
                     headers={'Accept': 'application/json'}
                 )
                 response.raise_for_status()
-                data = response.json()
+                with tracer.span('json.parse', bytes=len(response.content)):
+                    data = response.json()
+                pack_files = decode_pack_files((data.get('pack') or {}).get('files'))
                 
                 if config.get('cache_enabled') and not no_cache:
-                    with open(cache_file, 'w', encoding='utf-8') as f:
-                        json.dump(data, f)
-                
+                    # Decode once and reuse the result for both the cache entry and the install
+                    pack_files = list(pack_files)
+                    with tracer.span('cache.write') as span:
+                        span['bytes'] = CacheEntry.write(cache_file, data, pack_files, len(response.content))
+                return data, pack_files
+            
+            if entry:
+                data = entry.data
+                pack_files = entry.iter_files()
+            else:
+                # Cache missing, expired or bypassed - fetch fresh
+                data, pack_files = fetch()
                 progress.update(task1, completed=True)
             
             if not data.get('success'):
@@ -176,37 +1143,61 @@ def install(package_spec, version, global_install, save, save_dev, force, no_cac
                 console.print(f"[yellow]⚠ Package already installed. Use --force to reinstall.[/yellow]")
                 return
             
-            # Create directory
-            package_dir.mkdir(parents=True, exist_ok=True)
+            # Files are written to a staging dir and renamed into place, so a
+            # failure never leaves a partial package_dir without pack-info.json
+            package_dir.parent.mkdir(parents=True, exist_ok=True)
+            staging_dir = package_dir.parent / f".{package_dir.name}-{os.getpid()}.tmp"
             progress.update(task2, completed=True)
             
             # Task 3: Download files
             task3 = progress.add_task(f"📥 Downloading files...", total=len(pack.get('files', {})))
             
-            for filename, content in pack.get('files', {}).items():
-                file_path = package_dir / filename
-                file_path.parent.mkdir(parents=True, exist_ok=True)
+            def write_files(pack_files):
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                staging_dir.mkdir()
+                progress.reset(task3)
+                with tracer.span('files.write', files=len(pack.get('files', {}))) as write_span:
+                    sizes = {}
+                    for filename, kind, prefix, payload in pack_files:
+                        file_path = staging_dir / filename
+                        file_path.parent.mkdir(parents=True, exist_ok=True)
+                        write_pack_file(file_path, kind, payload)
+                        sizes[filename] = len(payload) if kind == 'data' else len(payload.encode('utf-8'))
+                        progress.update(task3, advance=1)
+                    write_span['bytes'] = sum(sizes.values())
+                return sizes
+            
+            try:
+                try:
+                    sizes = write_files(pack_files)
+                except CacheFormatError as e:
+                    if not entry:
+                        raise
+                    # The entry's metadata was fine but a payload isn't; drop it and refetch
+                    console.print(f"[yellow]⚠ Cached copy is corrupt ({e}), fetching again[/yellow]")
+                    telemetry.count('cache_corrupt')
+                    entry.close()
+                    entry = None
+                    cache_file.unlink(missing_ok=True)
+                    data, pack_files = fetch()
+                    if not data.get('success'):
+                        console.print(f"[red]✗ Installation failed: {data.get('error', {}).get('message', 'Unknown error')}[/red]")
+                        return
+                    pack = data['pack']
+                    sizes = write_files(pack_files)
                 
-                # Handle different content types
-                if isinstance(content, str):
-                    if content.startswith('data:'):
-                        # Handle base64 encoded content
-                        content_type, content_data = content.split(',', 1)
-                        file_content = base64.b64decode(content_data)
-                        with open(file_path, 'wb') as f:
-                            f.write(file_content)
-                    else:
-                        with open(file_path, 'w', encoding='utf-8') as f:
-                            f.write(content)
-                else:
-                    with open(file_path, 'wb') as f:
-                        f.write(content)
+                # Save package info; file contents live in the package dir, so only record sizes
+                with tracer.span('manifest.write'):
+                    with open(staging_dir / 'pack-info.json', 'w', encoding='utf-8') as f:
+                        json.dump({**pack, 'files': sizes}, f, indent=2)
                 
-                progress.update(task3, advance=1)
-            
-            # Save package info
-            with open(package_dir / 'pack-info.json', 'w', encoding='utf-8') as f:
-                json.dump(pack, f, indent=2)
+                if package_dir.exists():
+                    # --force reinstall: swap the old copy out through the trash
+                    move_to_trash(package_dir)
+                    empty_trash_in_background()
+                os.rename(staging_dir, package_dir)
+            finally:
+                shutil.rmtree(staging_dir, ignore_errors=True)
             
             progress.update(task3, completed=True)
             
@@ -223,8 +1214,9 @@ def install(package_spec, version, global_install, save, save_dev, force, no_cac
                     
                     package_json[dep_type][pack.get('name', pack['id'])] = f"^{pack.get('version', '1.0.0')}"
                     
-                    with open(package_json_path, 'w', encoding='utf-8') as f:
-                        json.dump(package_json, f, indent=2)
+                    with tracer.span('package_json.write'):
+                        with open(package_json_path, 'w', encoding='utf-8') as f:
+                            json.dump(package_json, f, indent=2)
                     
                     console.print(f"[green]✓ Saved to {dep_type} in package.json[/green]")
             
@@ -287,6 +1279,10 @@ def install(package_spec, version, global_install, save, save_dev, force, no_cac
                 except:
                     # If not JSON, show raw response
                     console.print(f"[yellow]Response: {e.response.text[:200]}[/yellow]")
+        
+        finally:
+            if entry:
+                entry.close()
 
 # ============================================================================
 # SEARCH COMMAND
@@ -303,6 +1299,7 @@ def search(query, package_type, limit, output_json):
     If no query is provided, shows popular packages.
     """
     
+    console = current_console()
     config = load_config()
     
     with Progress(
@@ -321,10 +1318,11 @@ def search(query, package_type, limit, output_json):
             if limit:
                 params['limit'] = limit
             
-            response = requests.get(f"{config['registry']}/api/search", params=params)
+            response = registry_pool(config).get("/api/search", params=params)
             response.raise_for_status()
             
-            data = response.json()
+            with tracer.span('json.parse', bytes=len(response.content)):
+                data = response.json()
             progress.update(task, completed=True)
             
             if output_json:
@@ -372,6 +1370,7 @@ def search(query, package_type, limit, output_json):
 def info(package, output_json):
     """Show detailed package information"""
     
+    console = current_console()
     config = load_config()
     
     with Progress(
@@ -382,15 +1381,32 @@ def info(package, output_json):
         task = progress.add_task(f"📦 Fetching {package} info...", total=None)
         
         try:
-            # Use API endpoint instead of HTML page
-            response = requests.get(
-                f"{config['registry']}/api/get-pack", 
-                params={'id': package},
-                headers={'Accept': 'application/json'}
-            )
-            response.raise_for_status()
+            # A fresh cache entry answers everything but --json from its metadata alone
+            entry = None
+            if not output_json and config.get('cache_enabled'):
+                cache_file = cache_path(package)
+                with tracer.span('cache.read'):
+                    entry = open_cache_entry(cache_file, config)
+                if entry:
+                    telemetry.count('cache_hits')
+                    telemetry.count('bytes_from_cache', entry.response_size)
+                else:
+                    telemetry.count('cache_revalidations' if cache_file.exists() else 'cache_misses')
             
-            data = response.json()
+            if entry:
+                with entry:
+                    data = entry.data
+            else:
+                # Use API endpoint instead of HTML page
+                response = registry_pool(config).get(
+                    "/api/get-pack",
+                    params={'id': package},
+                    headers={'Accept': 'application/json'}
+                )
+                response.raise_for_status()
+                
+                with tracer.span('json.parse', bytes=len(response.content)):
+                    data = response.json()
             progress.update(task, completed=True)
             
             if output_json:
@@ -491,7 +1507,7 @@ def list_packages(global_list):
             console.print("\n[dim]Install a package with: pack install <package>[/dim]")
         return
     
-    packages = list(install_dir.glob('*'))
+    packages = [p for p in install_dir.glob('*') if not p.name.startswith('.')]
     
     if not packages:
         console.print("[yellow]No packages installed.[/yellow]")
@@ -514,9 +1530,11 @@ def list_packages(global_list):
                 
                 # Calculate size
                 size = 0
-                for file in package_dir.rglob('*'):
-                    if file.is_file() and file.name != 'pack-info.json':
-                        size += file.stat().st_size
+                with tracer.span('size.scan', package=package_dir.name) as span:
+                    for file in package_dir.rglob('*'):
+                        if file.is_file() and file.name != 'pack-info.json':
+                            size += file.stat().st_size
+                    span['bytes'] = size
                 total_size += size
                 
                 table.add_row(
@@ -534,46 +1552,302 @@ def list_packages(global_list):
 # UNINSTALL COMMAND
 # ============================================================================
 
+def local_install_dirs(config, global_install=False):
+    """Directories `install` may have written packages to"""
+    if global_install:
+        return [Path(config.get('global_install_path'))]
+    return [Path.cwd() / 'node_modules', Path.cwd() / 'pack_modules', INSTALL_DIR]
+
+def is_valid_package_name(package):
+    """True for `name` or `@scope/name` with no empty, dot-leading or path segments
+    
+    uninstall joins the name onto install dirs, so anything else could point
+    at the install dir itself, its trash area or somewhere outside it.
+    """
+    segments = package.split('/')
+    if len(segments) == 2 and segments[0].startswith('@'):
+        segments = [segments[0][1:], segments[1]]
+    elif len(segments) != 1:
+        return False
+    return all(segment and not segment.startswith('.') and '\\' not in segment
+               for segment in segments)
+
+def find_pack_dir(install_dir, package):
+    """Return the directory pack installed `package` to in install_dir, or None
+    
+    The candidate must resolve to a path strictly inside install_dir and
+    carry the pack-info.json that install writes, so directories npm or the
+    user created (node_modules is shared with npm) are never touched.
+    """
+    root = install_dir.resolve()
+    package_dir = (install_dir / package).resolve()
+    if package_dir == root or root not in package_dir.parents:
+        return None
+    if not (package_dir / 'pack-info.json').is_file():
+        return None
+    return package_dir
+
+def load_trash_roots():
+    if TRASH_INDEX_FILE.exists():
+        try:
+            with open(TRASH_INDEX_FILE, encoding='utf-8') as f:
+                return [Path(root) for root in json.load(f)]
+        except (OSError, ValueError):
+            pass
+    return []
+
+def save_trash_roots(roots):
+    if roots:
+        write_atomic(TRASH_INDEX_FILE, json.dumps(sorted(str(root) for root in roots)))
+    elif TRASH_INDEX_FILE.exists():
+        TRASH_INDEX_FILE.unlink()
+
+_trash_lock = threading.Lock()
+
+@contextmanager
+def trash_index_locked():
+    """Serialize trash index updates across threads and pack processes"""
+    with _trash_lock, open(CONFIG_DIR / "trash.lock", 'w') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+def move_to_trash(package_dir):
+    """Rename package_dir into a trash area next to it and return the new path
+    
+    The trash lives inside the same install directory so the rename never
+    crosses filesystems and is effectively instant. Deletion happens later
+    in empty_trash().
+    """
+    trash_root = package_dir.parent / TRASH_DIRNAME
+    target = trash_root / f"{package_dir.name}-{os.getpid()}-{time.time_ns()}"
+    with tracer.span('trash.move', package=package_dir.name):
+        for attempt in range(3):
+            trash_root.mkdir(exist_ok=True)
+            try:
+                os.rename(package_dir, target)
+                break
+            except FileNotFoundError:
+                # empty_trash() removed the (empty) root after our mkdir; recreate it
+                if attempt == 2 or not os.path.lexists(package_dir):
+                    raise
+    
+    with trash_index_locked():
+        roots = set(load_trash_roots())
+        roots.add(trash_root)
+        save_trash_roots(roots)
+    return target
+
+def empty_trash():
+    """Delete everything in known trash areas, forgetting roots that end up empty"""
+    for root in load_trash_roots():
+        if root.exists():
+            for entry in root.iterdir():
+                shutil.rmtree(entry, ignore_errors=True)
+        # Remove the root and its index entry together, so a concurrent
+        # move_to_trash() either finds the root gone and recreates it, or
+        # re-adds it to the index after we're done
+        with trash_index_locked():
+            try:
+                if root.exists():
+                    root.rmdir()
+            except OSError:
+                # New entries arrived or something couldn't be deleted; retry next run
+                continue
+            save_trash_roots(set(load_trash_roots()) - {root})
+
+def empty_trash_in_background():
+    """Run empty_trash() in a detached `pack trash empty` process
+    
+    A thread would die with this process, usually long before a large
+    package is deleted. If the child can't start or is killed, the rest is
+    picked up on the next run.
+    """
+    try:
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), 'trash', 'empty'],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+    except OSError:
+        pass
+
+def remove_packages(package_dirs):
+    """Move package dirs to the trash, returning (removed, failed) lists"""
+    removed, failed = [], []
+    for package_dir in package_dirs:
+        try:
+            move_to_trash(package_dir)
+            removed.append(package_dir)
+        except OSError as e:
+            failed.append((package_dir, e))
+    
+    if removed:
+        empty_trash_in_background()
+    return removed, failed
+
+def report_removal(removed, failed, verb):
+    for package_dir in removed:
+        console.print(f"[green]✓ {verb} {package_dir.name}[/green] [dim]({package_dir.parent})[/dim]")
+    for package_dir, error in failed:
+        console.print(f"[red]✗ Failed to remove {package_dir}: {error}[/red]")
+
+@cli.group(hidden=True)
+def trash():
+    """Manage packages removed by uninstall and prune"""
+    pass
+
+@trash.command('empty')
+def trash_empty():
+    """Delete everything in the trash; started in the background by pack itself"""
+    with open(CONFIG_DIR / "trash-empty.lock", 'w') as lock_file:
+        if fcntl:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                # Another `pack trash empty` is already at it
+                return
+        empty_trash()
+
 @cli.command()
-@click.argument('package')
+@click.argument('packages', nargs=-1, required=True)
 @click.option('--global', '-g', 'global_uninstall', is_flag=True, help='Uninstall globally')
 @click.option('--yes', '-y', is_flag=True, help='Skip confirmation')
-def uninstall(package, global_uninstall, yes):
-    """Uninstall a package"""
+def uninstall(packages, global_uninstall, yes):
+    """Uninstall one or more packages
     
-    config = load_config()
+    Looks in node_modules and pack_modules in the current directory and in
+    ~/.pack/packages (or the global install path with --global). Packages
+    are moved to a trash area immediately and deleted in the background.
     
-    if global_uninstall:
-        install_dir = Path(config.get('global_install_path'))
-    else:
-        install_dir = INSTALL_DIR
+    Examples:
     
-    package_dir = install_dir / package
+        pack uninstall Galaxies
+        pack uninstall Galaxies Nebula -y
+    """
+    config = load_config()
     
-    if not package_dir.exists():
-        console.print(f"[red]Package {package} not found in {'global' if global_uninstall else 'local'} installation[/red]")
+    to_remove = []
+    for package in dict.fromkeys(packages):
+        if not is_valid_package_name(package):
+            console.print(f"[red]✗ Invalid package name: {package}[/red]")
+            continue
+        matches = [package_dir for package_dir in
+                   (find_pack_dir(install_dir, package) for install_dir in local_install_dirs(config, global_uninstall))
+                   if package_dir]
+        if not matches:
+            console.print(f"[red]Package {package} not found in {'global' if global_uninstall else 'local'} installation[/red]")
+        # Install dirs symlinked to each other resolve to the same package dir
+        to_remove.extend(match for match in dict.fromkeys(matches) if match not in to_remove)
+    
+    if not to_remove:
         return
     
     # Confirm
     if not yes:
-        if not Confirm.ask(f"Are you sure you want to uninstall {package}?"):
+        names = ', '.join(sorted({package_dir.name for package_dir in to_remove}))
+        if not Confirm.ask(f"Are you sure you want to uninstall {names}?"):
             console.print("[yellow]Uninstall cancelled.[/yellow]")
             return
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task(f"🗑️ Uninstalling {package}...", total=None)
-        
-        try:
-            shutil.rmtree(package_dir)
-            progress.update(task, completed=True)
-            console.print(f"[green]✓ Successfully uninstalled {package}[/green]")
-        except Exception as e:
-            progress.stop()
-            console.print(f"[red]✗ Failed to uninstall: {str(e)}[/red]")
+    removed, failed = remove_packages(to_remove)
+    report_removal(removed, failed, "Successfully uninstalled")
+
+# ============================================================================
+# PRUNE COMMAND
+# ============================================================================
+
+def declared_packages(project_dir):
+    """Names listed in package.json and package-lock.json, or None without package.json"""
+    package_json_path = project_dir / 'package.json'
+    if not package_json_path.exists():
+        return None
+    
+    with open(package_json_path, encoding='utf-8') as f:
+        package_json = json.load(f)
+    
+    names = set()
+    for dep_type in ('dependencies', 'devDependencies', 'optionalDependencies', 'peerDependencies'):
+        names.update(package_json.get(dep_type) or {})
+    
+    lock_path = project_dir / 'package-lock.json'
+    if lock_path.exists():
+        with open(lock_path, encoding='utf-8') as f:
+            lock = json.load(f)
+        # lockfileVersion 2/3 key packages by path, version 1 by name
+        for key in lock.get('packages') or {}:
+            if key.startswith('node_modules/'):
+                names.add(key[len('node_modules/'):])
+        names.update(lock.get('dependencies') or {})
+    
+    return names
+
+def installed_package_dirs(install_dir):
+    """Yield (name, path) for package dirs in install_dir, descending into @scope dirs"""
+    for entry in install_dir.iterdir():
+        if entry.name.startswith('.') or not entry.is_dir():
+            continue
+        if entry.name.startswith('@'):
+            for package_dir in entry.iterdir():
+                if not package_dir.name.startswith('.') and package_dir.is_dir():
+                    yield f"{entry.name}/{package_dir.name}", package_dir
+        else:
+            yield entry.name, entry
+
+@cli.command()
+@click.option('--dry-run', '-n', is_flag=True, help='Show what would be removed')
+@click.option('--yes', '-y', is_flag=True, help='Skip confirmation')
+def prune(dry_run, yes):
+    """Remove installed packs not listed in package.json or package-lock.json
+    
+    Only directories installed by pack (with a pack-info.json) in
+    ./node_modules and ./pack_modules are considered, including scoped
+    packages under @scope directories.
+    """
+    declared = declared_packages(Path.cwd())
+    if declared is None:
+        console.print("[red]✗ package.json not found[/red]")
+        return
+    
+    extraneous = []
+    for install_dir in (Path.cwd() / 'node_modules', Path.cwd() / 'pack_modules'):
+        if not install_dir.exists():
+            continue
+        for name, package_dir in installed_package_dirs(install_dir):
+            manifest_file = package_dir / 'pack-info.json'
+            if not manifest_file.exists():
+                continue
+            try:
+                with open(manifest_file, encoding='utf-8') as f:
+                    pack = json.load(f)
+            except (OSError, ValueError) as e:
+                console.print(f"[yellow]⚠ Skipping {name}: unreadable pack-info.json ({e})[/yellow]")
+                continue
+            if not isinstance(pack, dict):
+                console.print(f"[yellow]⚠ Skipping {name}: unreadable pack-info.json[/yellow]")
+                continue
+            if not {name, pack.get('name'), pack.get('id')} & declared:
+                extraneous.append(package_dir)
+    
+    if not extraneous:
+        console.print("[green]✓ Nothing to prune[/green]")
+        return
+    
+    if dry_run:
+        for package_dir in extraneous:
+            console.print(f"  • {package_dir.name} [dim]({package_dir.parent})[/dim]")
+        console.print(f"\n[dim]{len(extraneous)} packages would be removed[/dim]")
+        return
+    
+    if not yes:
+        if not Confirm.ask(f"Remove {len(extraneous)} extraneous packages?"):
+            console.print("[yellow]Prune cancelled.[/yellow]")
+            return
+    
+    removed, failed = remove_packages(extraneous)
+    report_removal(removed, failed, "Pruned")
 
 # ============================================================================
 # PUBLISH COMMAND
@@ -630,18 +1904,18 @@ def publish(path, key, public, package_type):
         # Task 2: Create archive
         task2 = progress.add_task("📦 Creating package archive...", total=None)
         
-        import tempfile
-        
         with tempfile.NamedTemporaryFile(suffix='.tar.gz', delete=False) as tmp:
             archive_path = tmp.name
         
         try:
             # Create tar.gz archive
-            with tarfile.open(archive_path, 'w:gz') as tar:
-                for file_path in path.rglob('*'):
-                    if file_path.is_file() and not any(part.startswith('.') for part in file_path.parts):
-                        arcname = file_path.relative_to(path)
-                        tar.add(file_path, arcname=arcname)
+            with tracer.span('archive.create') as span:
+                with tarfile.open(archive_path, 'w:gz') as tar:
+                    for file_path in path.rglob('*'):
+                        if file_path.is_file() and not any(part.startswith('.') for part in file_path.parts):
+                            arcname = file_path.relative_to(path)
+                            tar.add(file_path, arcname=arcname)
+                span['bytes'] = os.path.getsize(archive_path)
             
             progress.update(task2, completed=True)
             
@@ -658,12 +1932,20 @@ def publish(path, key, public, package_type):
                     'type': package_type or package_json.get('type', 'basic')
                 }
                 
-                response = requests.post(
-                    f"{config['registry']}/api/publish",
-                    files=files,
-                    data=data,
-                    headers={'Authorization': f'Bearer {api_key}'}
+                with tracer.span('http.post', endpoint=config['registry'], path='/api/publish') as span:
+                    response = requests.post(
+                        f"{config['registry']}/api/publish",
+                        files=files,
+                        data=data,
+                        headers={'Authorization': f'Bearer {api_key}'}
+                    )
+                    span['status'] = response.status_code
+                    span['bytes'] = os.path.getsize(archive_path)
+                telemetry.observe_request(
+                    config['registry'], '/api/publish',
+                    response.elapsed.total_seconds(), 0, response.status_code < 500
                 )
+                telemetry.count('bytes_uploaded', os.path.getsize(archive_path))
             
             progress.update(task3, completed=True)
             
@@ -769,7 +2051,7 @@ def cache_clear():
 @cache.command('info')
 def cache_info():
     """Show cache information"""
-    cache_files = list(CACHE_DIR.glob('*'))
+    cache_files = list(CACHE_DIR.glob(f'*{CACHE_SUFFIX}'))
     
     if not cache_files:
         console.print("[yellow]Cache is empty[/yellow]")
@@ -787,6 +2069,363 @@ def cache_info():
     
     console.print(table)
 
+# ============================================================================
+# STATS COMMAND
+# ============================================================================
+
+@cli.command()
+@click.option('--json', '-j', 'output_json', is_flag=True, help='Output as JSON')
+@click.option('--prometheus', '-p', is_flag=True, help='Output in Prometheus text format')
+@click.option('--reset', is_flag=True, help='Clear all recorded statistics')
+def stats(output_json, prometheus, reset):
+    """Show cumulative cache and request statistics
+    
+    Recording is opt-in: pack config set telemetry_enabled true
+    To feed node_exporter's textfile collector, also set telemetry_textfile
+    to a .prom path inside its collector directory.
+    """
+    config = load_config()
+    
+    if reset:
+        telemetry.reset()
+        console.print("[green]✓ Statistics reset[/green]")
+        return
+    
+    telemetry.flush()
+    data = telemetry.load()
+    
+    if output_json:
+        console.print(json.dumps(data, indent=2))
+        return
+    
+    if prometheus:
+        click.echo(telemetry.prometheus(data), nl=False)
+        return
+    
+    if not config.get('telemetry_enabled'):
+        console.print("[yellow]⚠ Telemetry is disabled. Enable with: pack config set telemetry_enabled true[/yellow]")
+    
+    counters = data['counters']
+    lookups = counters['cache_hits'] + counters['cache_misses'] + counters['cache_revalidations']
+    served = counters['bytes_downloaded'] + counters['bytes_from_cache']
+    
+    def human(size):
+        return f"{size / 1024:.1f} KB" if size < 1024*1024 else f"{size / (1024*1024):.1f} MB"
+    
+    table = Table(title=f"📈 Statistics since {data['since']}")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green")
+    
+    table.add_row("Cache Hits", str(counters['cache_hits']))
+    table.add_row("Cache Misses", str(counters['cache_misses']))
+    table.add_row("Cache Revalidations", str(counters['cache_revalidations']))
+    table.add_row("Corrupt Cache Entries", str(counters['cache_corrupt']))
+    table.add_row("Cache Hit Ratio", f"{counters['cache_hits'] / lookups:.1%}" if lookups else "-")
+    table.add_row("Downloaded", human(counters['bytes_downloaded']))
+    table.add_row("Served From Cache", human(counters['bytes_from_cache']))
+    table.add_row("Cache Byte Ratio", f"{counters['bytes_from_cache'] / served:.1%}" if served else "-")
+    table.add_row("Uploaded", human(counters['bytes_uploaded']))
+    
+    console.print(table)
+    
+    if data['requests']:
+        requests_table = Table(title="🌐 Requests")
+        requests_table.add_column("Registry", style="cyan")
+        requests_table.add_column("Endpoint", style="magenta")
+        requests_table.add_column("Count", justify="right")
+        requests_table.add_column("Errors", style="red", justify="right")
+        requests_table.add_column("Mean", style="green", justify="right")
+        requests_table.add_column("p50 ≤", style="green", justify="right")
+        requests_table.add_column("p95 ≤", style="yellow", justify="right")
+        
+        def bound(seconds):
+            return "∞" if seconds == float('inf') else f"{seconds * 1000:.0f} ms"
+        
+        for key, entry in sorted(data['requests'].items()):
+            registry_url, path = key.split(' ', 1)
+            requests_table.add_row(
+                registry_url,
+                path,
+                str(entry['count']),
+                str(entry['errors']),
+                f"{entry['sum'] / entry['count'] * 1000:.0f} ms",
+                bound(telemetry.quantile(entry, 0.5)),
+                bound(telemetry.quantile(entry, 0.95))
+            )
+        
+        console.print(requests_table)
+
+# ============================================================================
+# REGISTRY COMMAND
+# ============================================================================
+
+@cli.group()
+def registry():
+    """Manage registries and mirrors"""
+    pass
+
+@registry.command('list')
+@click.option('--check', '-c', is_flag=True, help='Probe every endpoint before listing')
+def registry_list(check):
+    """Show registries with health and latency"""
+    config = load_config()
+    pool = RegistryPool(config)
+    
+    if check:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            task = progress.add_task("🩺 Checking registries...", total=None)
+            pool.check_health(force=True)
+            progress.update(task, completed=True)
+    
+    table = Table(title="Registries")
+    table.add_column("#", style="dim", width=4)
+    table.add_column("URL", style="cyan")
+    table.add_column("Status", justify="center")
+    table.add_column("Probe p50", style="green")
+    table.add_column("Samples", style="dim")
+    table.add_column("get-pack p50", style="green")
+    table.add_column("get-pack p95", style="yellow")
+    
+    def ms(seconds):
+        return f"{seconds * 1000:.0f} ms" if seconds is not None else "-"
+    
+    for i, url in enumerate(pool.ranked('/api/get-pack'), 1):
+        table.add_row(
+            str(i),
+            url,
+            "✅" if pool.is_healthy(url) else "❌",
+            ms(pool.percentile(url, 50, pool.PROBE_WINDOW)),
+            str(len(pool.samples(url, '/api/get-pack'))),
+            ms(pool.percentile(url, 50, '/api/get-pack')),
+            ms(pool.percentile(url, 95, '/api/get-pack'))
+        )
+    
+    console.print(table)
+
+@registry.command('add')
+@click.argument('url')
+def registry_add(url):
+    """Add a registry mirror"""
+    config = load_config()
+    url = url.rstrip('/')
+    registries = list(config.get('registries') or [])
+    
+    if url == config['registry'].rstrip('/') or url in registries:
+        console.print(f"[yellow]⚠ {url} is already configured[/yellow]")
+        return
+    
+    registries.append(url)
+    config['registries'] = registries
+    save_config(config)
+    console.print(f"[green]✓ Added registry {url}[/green]")
+
+@registry.command('remove')
+@click.argument('url')
+def registry_remove(url):
+    """Remove a registry mirror"""
+    config = load_config()
+    url = url.rstrip('/')
+    registries = list(config.get('registries') or [])
+    
+    if url not in registries:
+        console.print(f"[red]Registry {url} not found[/red]")
+        return
+    
+    registries.remove(url)
+    config['registries'] = registries
+    save_config(config)
+    console.print(f"[green]✓ Removed registry {url}[/green]")
+
+# ============================================================================
+# DAEMON COMMAND
+# ============================================================================
+
+class DaemonHandler(socketserver.StreamRequestHandler):
+    """Handles one JSON request per connection from forward_to_daemon()"""
+    
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        
+        op = request.get('op')
+        if op == 'run' and request.get('argv', [None])[0] in DAEMON_COMMANDS:
+            output, exit_code = run_captured(
+                request['argv'],
+                width=request.get('width', 80),
+                color=request.get('color', False)
+            )
+            with self.server.lock:
+                self.server.served += 1
+            telemetry.flush()
+            reply = {'output': output, 'exit_code': exit_code}
+        elif op == 'ping':
+            reply = {
+                'pid': os.getpid(),
+                'uptime': time.time() - self.server.started_at,
+                'served': self.server.served,
+                'cached': len(_registry_pool.memo) if _registry_pool and _registry_pool.memo is not None else 0
+            }
+        elif op == 'stop':
+            reply = {'stopping': True}
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        else:
+            reply = {'output': '', 'exit_code': 2}
+        
+        self.wfile.write(json.dumps(reply).encode())
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serves each connection on its own thread so one slow request doesn't block the rest"""
+    daemon_threads = True
+
+def run_captured(argv, width=80, color=False):
+    """Run a CLI command in-process, returning its console output and exit code
+    
+    Safe to call from several threads at once: output goes to a Console
+    private to this call, handed to the command via ctx.obj.
+    """
+    buffer = io.StringIO()
+    console = Console(file=buffer, width=width, force_terminal=color, force_interactive=False)
+    exit_code = 0
+    
+    try:
+        result = cli.main(args=list(argv), prog_name='pack', standalone_mode=False, obj={'console': console})
+        if isinstance(result, int):
+            exit_code = result
+    except click.ClickException as e:
+        buffer.write(f"Error: {e.format_message()}\n")
+        exit_code = e.exit_code
+    except click.Abort:
+        exit_code = 1
+    except Exception as e:
+        console.print(f"\n[red]Unexpected error: {str(e)}[/red]")
+        exit_code = 1
+    
+    return buffer.getvalue(), exit_code
+
+def daemon_request(op):
+    """Send a control request to the daemon, returning None if it isn't running"""
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.settimeout(2)
+        client.connect(DAEMON_SOCKET)
+        client.sendall(json.dumps({'op': op}).encode() + b'\n')
+        chunks = []
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return json.loads(b''.join(chunks))
+    except (OSError, ValueError):
+        return None
+    finally:
+        client.close()
+
+@cli.group()
+def daemon():
+    """Manage the background daemon
+    
+    While the daemon is running, `pack info` and `pack search` are served
+    by it over a Unix socket, reusing its loaded config, HTTP connections
+    and in-memory metadata cache. Set PACK_NO_DAEMON=1 to bypass it.
+    """
+    pass
+
+@daemon.command('start')
+def daemon_start():
+    """Start the daemon in the background"""
+    if daemon_request('ping'):
+        console.print("[yellow]⚠ Daemon is already running[/yellow]")
+        return
+    
+    subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), 'daemon', 'run'],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        status = daemon_request('ping')
+        if status:
+            console.print(f"[green]✓ Daemon started (pid {status['pid']})[/green]")
+            return
+        time.sleep(0.05)
+    
+    console.print("[red]✗ Daemon did not start. Run `pack daemon run` to see errors.[/red]")
+
+@daemon.command('run')
+def daemon_run():
+    """Run the daemon in the foreground"""
+    global _daemon_mode
+    
+    if not hasattr(socket, 'AF_UNIX'):
+        console.print("[red]✗ Unix sockets are not supported on this platform[/red]")
+        return
+    
+    if daemon_request('ping'):
+        console.print("[yellow]⚠ Daemon is already running[/yellow]")
+        return
+    
+    # A leftover socket from a crashed daemon would make bind() fail
+    if os.path.exists(DAEMON_SOCKET):
+        os.unlink(DAEMON_SOCKET)
+    
+    _daemon_mode = True
+    registry_pool(load_config())
+    
+    server = DaemonServer(DAEMON_SOCKET, DaemonHandler)
+    server.started_at = time.time()
+    server.served = 0
+    server.lock = threading.Lock()
+    os.chmod(DAEMON_SOCKET, 0o600)
+    
+    console.print(f"[green]✓ Daemon listening on {DAEMON_SOCKET}[/green]")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(DAEMON_SOCKET):
+            os.unlink(DAEMON_SOCKET)
+
+@daemon.command('stop')
+def daemon_stop():
+    """Stop the running daemon"""
+    if daemon_request('stop'):
+        console.print("[green]✓ Daemon stopped[/green]")
+    else:
+        console.print("[yellow]Daemon is not running[/yellow]")
+
+@daemon.command('status')
+def daemon_status():
+    """Show daemon status"""
+    status = daemon_request('ping')
+    if not status:
+        console.print("[yellow]Daemon is not running[/yellow]")
+        return
+    
+    table = Table(title="Daemon Status")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green")
+    
+    table.add_row("PID", str(status['pid']))
+    table.add_row("Uptime", f"{status['uptime']:.0f}s")
+    table.add_row("Requests Served", str(status['served']))
+    table.add_row("Cached Responses", str(status['cached']))
+    table.add_row("Socket", DAEMON_SOCKET)
+    
+    console.print(table)
+
 # ============================================================================
 # VERSION COMMAND
 # ============================================================================